@@ -6,7 +6,7 @@ Demonstrates pure quantum dynamics (RT-NEO) for FHF- proton transfer.
 No constraint forces - just quantum time evolution!
 
 Usage:
-    python 01_basic_rtneo.py
+    python 01_basic_rtneo.py [--csv]
 """
 
 import sys
@@ -24,13 +24,15 @@ from rt_cneo_clean import (
 )
 
 
-def main():
+def main(save_csv: bool = False):
     """Run basic RT-NEO simulation."""
 
-    print("\n" + "="*80)
-    print(" RT-NEO: Pure Quantum Dynamics")
-    print(" (No trajectory smoothing - just quantum time evolution)")
-    print("="*80)
+    print("\n".join([
+        "\n" + "="*80,
+        " RT-NEO: Pure Quantum Dynamics",
+        " (No trajectory smoothing - just quantum time evolution)",
+        "="*80,
+    ]))
 
     # Setup parameters
     params = SimulationParameters(
@@ -58,9 +60,11 @@ def main():
     results = simulator.run_rtneo()
 
     # Analyze
-    print("\n" + "="*70)
-    print(" Results")
-    print("="*70)
+    print("\n".join([
+        "\n" + "="*70,
+        " Results",
+        "="*70,
+    ]))
 
     analyzer = TrajectoryAnalyzer()
     analysis = analyzer.analyze(results)
@@ -68,15 +72,28 @@ def main():
 
     # Save trajectory
     import numpy as np
-    np.savetxt(
-        "rtneo_basic_trajectory.csv",
-        np.column_stack([results.times, results.positions, results.energies]),
-        header="Time(au), Position(Å), Energy(au)",
-        delimiter=",",
-        fmt="%.6e"
+    np.savez_compressed(
+        "rtneo_basic_trajectory.npz",
+        times=results.times,
+        positions=results.positions,
+        energies=results.energies
     )
-    print(f"\nTrajectory saved to: rtneo_basic_trajectory.csv")
+    print(f"\nTrajectory saved to: rtneo_basic_trajectory.npz")
+
+    if save_csv:
+        columns = (results.times, results.positions, results.energies)
+        data = np.empty((len(results.times), len(columns)), dtype=np.float64)
+        for i, column in enumerate(columns):
+            data[:, i] = column
+        np.savetxt(
+            "rtneo_basic_trajectory.csv",
+            data,
+            header="Time(au), Position(Å), Energy(au)",
+            delimiter=",",
+            fmt="%.6e"
+        )
+        print(f"Trajectory saved to: rtneo_basic_trajectory.csv")
 
 
 if __name__ == "__main__":
-    main()
+    main(save_csv="--csv" in sys.argv)
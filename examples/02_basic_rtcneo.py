@@ -6,7 +6,7 @@ Demonstrates constrained quantum dynamics (RT-cNEO) for FHF- proton transfer.
 Includes constraint forces to extract smooth classical trajectory!
 
 Usage:
-    python 02_basic_rtcneo.py
+    python 02_basic_rtcneo.py [--csv]
 """
 
 import sys
@@ -24,13 +24,15 @@ from rt_cneo_clean import (
 )
 
 
-def main():
+def main(save_csv: bool = False):
     """Run basic RT-cNEO simulation."""
 
-    print("\n" + "="*80)
-    print(" RT-cNEO: Constrained Quantum Dynamics")
-    print(" (Quantum + constraint forces → smooth classical trajectory)")
-    print("="*80)
+    print("\n".join([
+        "\n" + "="*80,
+        " RT-cNEO: Constrained Quantum Dynamics",
+        " (Quantum + constraint forces → smooth classical trajectory)",
+        "="*80,
+    ]))
 
     # Setup parameters
     params = SimulationParameters(
@@ -62,9 +64,11 @@ def main():
     results = simulator.run_rtcneo()
 
     # Analyze
-    print("\n" + "="*70)
-    print(" Results")
-    print("="*70)
+    print("\n".join([
+        "\n" + "="*70,
+        " Results",
+        "="*70,
+    ]))
 
     analyzer = TrajectoryAnalyzer()
     analysis = analyzer.analyze(results)
@@ -74,25 +78,37 @@ def main():
     import numpy as np
     avg_constraint = np.mean(np.abs(results.constraint_forces))
     max_constraint = np.max(np.abs(results.constraint_forces))
-    print(f"\nConstraint Force Statistics:")
-    print(f"  Average magnitude: {avg_constraint*1000:.3f} ×10⁻³ au")
-    print(f"  Maximum magnitude: {max_constraint*1000:.3f} ×10⁻³ au")
+    print("\n".join([
+        f"\nConstraint Force Statistics:",
+        f"  Average magnitude: {avg_constraint*1000:.3f} ×10⁻³ au",
+        f"  Maximum magnitude: {max_constraint*1000:.3f} ×10⁻³ au",
+    ]))
 
     # Save trajectory
-    np.savetxt(
-        "rtcneo_basic_trajectory.csv",
-        np.column_stack([
-            results.times,
-            results.positions,
-            results.energies,
-            results.constraint_forces
-        ]),
-        header="Time(au), Position(Å), Energy(au), ConstraintForce(au)",
-        delimiter=",",
-        fmt="%.6e"
+    np.savez_compressed(
+        "rtcneo_basic_trajectory.npz",
+        times=results.times,
+        positions=results.positions,
+        energies=results.energies,
+        constraint_forces=results.constraint_forces
     )
-    print(f"\nTrajectory saved to: rtcneo_basic_trajectory.csv")
+    print(f"\nTrajectory saved to: rtcneo_basic_trajectory.npz")
+
+    if save_csv:
+        columns = (results.times, results.positions,
+                   results.energies, results.constraint_forces)
+        data = np.empty((len(results.times), len(columns)), dtype=np.float64)
+        for i, column in enumerate(columns):
+            data[:, i] = column
+        np.savetxt(
+            "rtcneo_basic_trajectory.csv",
+            data,
+            header="Time(au), Position(Å), Energy(au), ConstraintForce(au)",
+            delimiter=",",
+            fmt="%.6e"
+        )
+        print(f"Trajectory saved to: rtcneo_basic_trajectory.csv")
 
 
 if __name__ == "__main__":
-    main()
+    main(save_csv="--csv" in sys.argv)
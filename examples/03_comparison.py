@@ -23,10 +23,12 @@ from rtcneo.strategies import GaussianPulseField
 def main():
     """Run comprehensive RT-NEO vs RT-cNEO comparison."""
 
-    print("\n" + "="*80)
-    print(" RT-NEO vs RT-cNEO COMPARISON")
-    print(" Easy-to-use demonstration of quantum vs constrained dynamics")
-    print("="*80)
+    print("\n".join([
+        "\n" + "="*80,
+        " RT-NEO vs RT-cNEO COMPARISON",
+        " Easy-to-use demonstration of quantum vs constrained dynamics",
+        "="*80,
+    ]))
 
     # ========================================================================
     # STEP 1: Setup simulation parameters
@@ -44,10 +46,12 @@ def main():
         use_time_dependent_fock=False  # Static Fock for speed (set True for accuracy)
     )
 
-    print(f"  Time step: {params.time_step} au")
-    print(f"  Total time: {params.max_time} au (~{params.max_time/41.341:.1f} fs)")
-    print(f"  Field strength: {params.field_strength} au (~{params.field_strength*51.4:.1f} V/Å)")
-    print(f"  Smoothing time: {params.smoothing_time} au")
+    print("\n".join([
+        f"  Time step: {params.time_step} au",
+        f"  Total time: {params.max_time} au (~{params.max_time/41.341:.1f} fs)",
+        f"  Field strength: {params.field_strength} au (~{params.field_strength*51.4:.1f} V/Å)",
+        f"  Smoothing time: {params.smoothing_time} au",
+    ]))
 
     # ========================================================================
     # STEP 2: Setup external field strategy
@@ -91,16 +95,17 @@ def main():
     print("\nGenerating comprehensive report...")
     study.generate_report(output_dir="comparison_results")
 
-    print("\n" + "="*80)
-    print(" COMPARISON COMPLETE!")
-    print("="*80)
-    print("\nResults saved in: comparison_results/")
-    print("  - comparison_full.png         (4-panel comparison plot)")
-    print("  - constraint_analysis.png     (RT-cNEO constraint analysis)")
-    print("  - comparison_summary.txt      (detailed text summary)")
-    print("  - rtneo_trajectory.csv        (RT-NEO data)")
-    print("  - rtcneo_trajectory.csv       (RT-cNEO data)")
-    print("\n" + "="*80)
+    print("\n".join([
+        "\n" + "="*80,
+        " COMPARISON COMPLETE!",
+        "="*80,
+        "\nResults saved in: comparison_results/",
+        "  - comparison_full.png         (4-panel comparison plot)",
+        "  - constraint_analysis.png     (RT-cNEO constraint analysis)",
+        "  - comparison_summary.txt      (detailed text summary)",
+        "  - trajectories.npz            (RT-NEO and RT-cNEO data)",
+        "\n" + "="*80,
+    ]))
 
 
 if __name__ == "__main__":
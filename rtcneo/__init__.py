@@ -39,22 +39,38 @@ from .core.constants import (
 
 # Re-export the old monolithic module for backwards compatibility
 # This allows: from rtcneo import SimulationFactory
-try:
-    # Import from modularized structure when complete
-    from .dynamics.factory import SimulationFactory
-    from .dynamics.simulator import DynamicsSimulator
-except ImportError:
-    # Fall back to monolithic version during transition
-    import sys
-    import os
-    # Add parent directory to path to import rt_cneo_clean
-    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+# Resolved on first access (PEP 562) so that importing rtcneo does not pull in
+# the simulation backend and PySCF.
+_BACKEND_NAMES = ('SimulationFactory', 'DynamicsSimulator')
+
+
+def __getattr__(name):
+    if name not in _BACKEND_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
     try:
-        from rt_cneo_clean import SimulationFactory, DynamicsSimulator
+        # Import from modularized structure when complete
+        from .dynamics.factory import SimulationFactory
+        from .dynamics.simulator import DynamicsSimulator
     except ImportError:
-        print("Warning: Could not import SimulationFactory. Module structure incomplete.")
-        SimulationFactory = None
-        DynamicsSimulator = None
+        # Fall back to monolithic version during transition
+        import sys
+        import os
+        # Add parent directory to path to import rt_cneo_clean
+        repo_root = os.path.dirname(os.path.dirname(__file__))
+        if repo_root not in sys.path:
+            sys.path.insert(0, repo_root)
+        try:
+            from rt_cneo_clean import SimulationFactory, DynamicsSimulator
+        except ImportError:
+            print("Warning: Could not import SimulationFactory. Module structure incomplete.")
+            SimulationFactory = None
+            DynamicsSimulator = None
+
+    globals().update(SimulationFactory=SimulationFactory,
+                     DynamicsSimulator=DynamicsSimulator)
+    return globals()[name]
+
 
 __all__ = [
     'PhysicalConstants',
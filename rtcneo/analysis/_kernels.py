@@ -0,0 +1,114 @@
+"""
+Compiled kernels for RT-NEO vs RT-cNEO trajectory metrics.
+
+Numba is optional: when it is not installed, NUMBA_AVAILABLE is False and
+ComparisonMetrics falls back to its NumPy implementation.
+
+Kernels are JIT-compiled with cache=True, so the compilation cost is paid once
+per machine and later runs load the cached machine code. Ahead-of-time builds
+(numba.pycc) are deprecated upstream and are not used. The per-step scalar
+paths (potentials, fields, smoothing) are plain Python on purpose: they are
+called from the interpreter, where a jitted scalar call is slower than the
+Python expression.
+"""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+def _metrics_kernel(pos_a, pos_b, energy_a, energy_b, dt, stride):
+    """
+    Single pass over both trajectories returning the raw metric statistics.
+
+    Sums are accumulated relative to the first sample of each array so that
+    E[x²] - E[x]² stays accurate for energies with a large constant offset.
+    Roughness uses every sample; correlation and drift use every stride-th.
+
+    Returns:
+        (roughness_a, roughness_b, correlation, drift_a, drift_b)
+    """
+    n = pos_a.size
+    a0 = pos_a[0]
+    b0 = pos_b[0]
+    ea0 = energy_a[0]
+    eb0 = energy_b[0]
+
+    sum_a = 0.0
+    sum_b = 0.0
+    sum_aa = 0.0
+    sum_bb = 0.0
+    sum_ab = 0.0
+    sum_ea = 0.0
+    sum_eb = 0.0
+    sum_eaea = 0.0
+    sum_ebeb = 0.0
+    sum_d2a = 0.0
+    sum_d2b = 0.0
+    sum_d2a_sq = 0.0
+    sum_d2b_sq = 0.0
+
+    for i in range(n):
+        if i >= 2:
+            d2a = pos_a[i] - 2.0 * pos_a[i - 1] + pos_a[i - 2]
+            d2b = pos_b[i] - 2.0 * pos_b[i - 1] + pos_b[i - 2]
+            sum_d2a += d2a
+            sum_d2b += d2b
+            sum_d2a_sq += d2a * d2a
+            sum_d2b_sq += d2b * d2b
+
+        if i % stride != 0:
+            continue
+
+        da = pos_a[i] - a0
+        db = pos_b[i] - b0
+        sum_a += da
+        sum_b += db
+        sum_aa += da * da
+        sum_bb += db * db
+        sum_ab += da * db
+
+        dea = energy_a[i] - ea0
+        deb = energy_b[i] - eb0
+        sum_ea += dea
+        sum_eb += deb
+        sum_eaea += dea * dea
+        sum_ebeb += deb * deb
+
+    # Standard deviation of second differences, scaled to accelerations
+    m = n - 2
+    mean_d2a = sum_d2a / m
+    mean_d2b = sum_d2b / m
+    inv_dt2 = 1.0 / (dt * dt)
+    roughness_a = math.sqrt(max(sum_d2a_sq / m - mean_d2a * mean_d2a, 0.0)) * inv_dt2
+    roughness_b = math.sqrt(max(sum_d2b_sq / m - mean_d2b * mean_d2b, 0.0)) * inv_dt2
+
+    # Correlation and drift moments over the ns = ceil(n / stride) strided samples
+    ns = (n + stride - 1) // stride
+
+    # Pearson correlation of positions
+    mean_a = sum_a / ns
+    mean_b = sum_b / ns
+    cov_ab = sum_ab / ns - mean_a * mean_b
+    var_a = max(sum_aa / ns - mean_a * mean_a, 0.0)
+    var_b = max(sum_bb / ns - mean_b * mean_b, 0.0)
+    correlation = cov_ab / math.sqrt(var_a * var_b)
+
+    # Relative energy drift: std(E) / |mean(E)|
+    mean_ea = sum_ea / ns
+    mean_eb = sum_eb / ns
+    std_ea = math.sqrt(max(sum_eaea / ns - mean_ea * mean_ea, 0.0))
+    std_eb = math.sqrt(max(sum_ebeb / ns - mean_eb * mean_eb, 0.0))
+    drift_a = std_ea / abs(ea0 + mean_ea)
+    drift_b = std_eb / abs(eb0 + mean_eb)
+
+    return roughness_a, roughness_b, correlation, drift_a, drift_b
+
+
+if NUMBA_AVAILABLE:
+    _metrics_kernel = njit(cache=True, fastmath=True, error_model='numpy')(_metrics_kernel)
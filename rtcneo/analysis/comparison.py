@@ -5,27 +5,107 @@ This module provides high-level tools for comparing pure quantum dynamics (RT-NE
 with constrained trajectory extraction (RT-cNEO).
 """
 
-from typing import Dict, Optional, Tuple
+import functools
+import math
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
 
-# Import from monolithic version for now (will be refactored)
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
-try:
-    from rt_cneo_clean import (
-        SimulationFactory,
-        SimulationResults,
-        TrajectoryAnalyzer,
-        SimulationParameters
+from ..core.constants import PhysicalConstants, SimulationParameters, SimulationResults
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+@functools.lru_cache(maxsize=None)
+def _plt():
+    """Import matplotlib.pyplot on first use (the caller's backend is left as is)."""
+    import matplotlib.pyplot as plt
+    return plt
+
+
+@functools.lru_cache(maxsize=None)
+def _load_rt_cneo_clean():
+    """
+    Import the monolithic rt_cneo_clean module on first use.
+
+    Deferred so that importing rtcneo.analysis does not pull in PySCF.
+    Raises ImportError if the module cannot be found.
+    """
+    # Monolithic version lives at the repository root (will be refactored)
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    import rt_cneo_clean
+    return rt_cneo_clean
+
+
+def _mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and standard deviation from one shifted pass of first and second moments.
+
+    Shifting by the first sample keeps E[x²] - E[x]² accurate for energies with
+    a large constant offset (e.g. total energies of -200 Hartree).
+    """
+    shift = float(values[0])
+    shifted = values - shift
+    mean_shifted = float(shifted.mean())
+    variance = float(np.dot(shifted, shifted)) / shifted.size - mean_shifted * mean_shifted
+    return shift + mean_shifted, math.sqrt(max(variance, 0.0))
+
+
+def _relative_drift(energies: np.ndarray) -> float:
+    """Energy drift as relative standard deviation std(E) / |mean(E)|."""
+    mean, std = _mean_std(energies)
+    return std / abs(mean)
+
+
+def _ensure_contiguous(results: SimulationResults) -> None:
+    """Rebind result arrays as C-contiguous float64 (no copy if already so)."""
+    results.times = np.ascontiguousarray(results.times, dtype=np.float64)
+    results.positions = np.ascontiguousarray(results.positions, dtype=np.float64)
+    results.energies = np.ascontiguousarray(results.energies, dtype=np.float64)
+    results.constraint_forces = np.ascontiguousarray(results.constraint_forces,
+                                                     dtype=np.float64)
+
+
+def _create_simulator(parameters: SimulationParameters,
+                      field_strategy=None,
+                      potential_strategy=None):
+    """Create a full (non-simplified) simulator from the rt_cneo_clean backend."""
+    return _load_rt_cneo_clean().SimulationFactory.create_simulator(
+        parameters=parameters,
+        field_strategy=field_strategy,
+        potential_strategy=potential_strategy,
+        use_simplified=False
     )
-    RTCNEO_AVAILABLE = True
-except ImportError:
-    RTCNEO_AVAILABLE = False
-    print("Warning: rt_cneo_clean not available. Using fallback mode.")
+
+
+def _run_rtneo(parameters: SimulationParameters,
+               field_strategy=None,
+               potential_strategy=None) -> SimulationResults:
+    """Process-pool entry point: build a simulator and run RT-NEO."""
+    return _create_simulator(parameters, field_strategy, potential_strategy).run_rtneo()
+
+
+def _run_rtcneo(parameters: SimulationParameters,
+                field_strategy=None,
+                potential_strategy=None) -> SimulationResults:
+    """Process-pool entry point: build a simulator and run RT-cNEO."""
+    return _create_simulator(parameters, field_strategy, potential_strategy).run_rtcneo()
+
+
+def rtcneo_available() -> bool:
+    """Return True if the rt_cneo_clean simulation backend can be imported."""
+    try:
+        _load_rt_cneo_clean()
+        return True
+    except ImportError:
+        return False
 
 
 class ComparisonMetrics:
@@ -37,16 +117,16 @@ class ComparisonMetrics:
         """
         Calculate how much smoother RT-cNEO trajectory is compared to RT-NEO.
 
-        Returns ratio > 1 if RT-cNEO is smoother.
+        Returns ratio > 1 if RT-cNEO is smoother. Always uses every sample: a
+        second difference over a coarser spacing changes how noise is amplified,
+        so ratios computed at different strides are not comparable.
         """
-        dt = rtneo_results.times[1] - rtneo_results.times[0]
-
-        # Calculate accelerations (second derivative of position)
-        rtneo_vel = np.diff(rtneo_results.positions) / dt
-        rtcneo_vel = np.diff(rtcneo_results.positions) / dt
+        dt = float(rtneo_results.times[1] - rtneo_results.times[0])
+        inv_dt2 = 1.0 / (dt * dt)
 
-        rtneo_accel = np.diff(rtneo_vel) / dt
-        rtcneo_accel = np.diff(rtcneo_vel) / dt
+        # Calculate accelerations (second derivative of position) in one stencil pass
+        rtneo_accel = np.diff(rtneo_results.positions, n=2) * inv_dt2
+        rtcneo_accel = np.diff(rtcneo_results.positions, n=2) * inv_dt2
 
         # Smoothness = inverse of acceleration variance
         rtneo_roughness = np.std(rtneo_accel)
@@ -64,16 +144,24 @@ class ComparisonMetrics:
 
     @staticmethod
     def calculate_trajectory_correlation(rtneo_results: SimulationResults,
-                                        rtcneo_results: SimulationResults) -> float:
-        """Calculate Pearson correlation between trajectories."""
-        return np.corrcoef(rtneo_results.positions, rtcneo_results.positions)[0, 1]
+                                        rtcneo_results: SimulationResults,
+                                        stride: int = 1) -> float:
+        """Calculate Pearson correlation between trajectories (every stride-th sample)."""
+        rtneo_positions = rtneo_results.positions[::stride]
+        rtcneo_positions = rtcneo_results.positions[::stride]
+        rtneo_centered = rtneo_positions - rtneo_positions.mean()
+        rtcneo_centered = rtcneo_positions - rtcneo_positions.mean()
+        return float(np.dot(rtneo_centered, rtcneo_centered)
+                     / np.sqrt(np.dot(rtneo_centered, rtneo_centered)
+                               * np.dot(rtcneo_centered, rtcneo_centered)))
 
     @staticmethod
     def calculate_energy_drift_comparison(rtneo_results: SimulationResults,
-                                         rtcneo_results: SimulationResults) -> Dict[str, float]:
-        """Compare energy conservation between methods."""
-        rtneo_drift = np.std(rtneo_results.energies) / np.abs(np.mean(rtneo_results.energies))
-        rtcneo_drift = np.std(rtcneo_results.energies) / np.abs(np.mean(rtcneo_results.energies))
+                                         rtcneo_results: SimulationResults,
+                                         stride: int = 1) -> Dict[str, float]:
+        """Compare energy conservation between methods (every stride-th sample)."""
+        rtneo_drift = _relative_drift(rtneo_results.energies[::stride])
+        rtcneo_drift = _relative_drift(rtcneo_results.energies[::stride])
 
         return {
             'rtneo_drift': rtneo_drift,
@@ -81,6 +169,85 @@ class ComparisonMetrics:
             'drift_ratio': rtneo_drift / rtcneo_drift if rtcneo_drift > 0 else float('inf')
         }
 
+    @staticmethod
+    def calculate_all_metrics(rtneo_results: SimulationResults,
+                              rtcneo_results: SimulationResults,
+                              stride: int = 1) -> Dict:
+        """
+        Calculate smoothness, final position, correlation and energy drift together.
+
+        Both position trajectories are stacked into one (2, N) array, so the
+        position reductions run over the stacked data instead of re-walking each
+        result per metric; energy drift uses the same shifted one-pass moments
+        as calculate_energy_drift_comparison. When Numba is installed, a compiled
+        single-pass kernel computing the same quantities is used instead.
+        Requires both runs to have the same number of time steps.
+
+        With stride > 1 only every stride-th sample enters the correlation and
+        energy drift, which is useful for fast interactive recomputation (e.g.
+        stride=4 or 8). Smoothness always uses every sample (see
+        calculate_smoothness_ratio), and the final position difference always
+        uses the last stored step.
+        """
+        dt = float(rtneo_results.times[1] - rtneo_results.times[0])
+        rtneo_energies = rtneo_results.energies[::stride]
+        rtcneo_energies = rtcneo_results.energies[::stride]
+        final_position_diff = float(abs(rtneo_results.positions[-1]
+                                        - rtcneo_results.positions[-1]))
+
+        from ._kernels import NUMBA_AVAILABLE, _metrics_kernel
+
+        if NUMBA_AVAILABLE:
+            roughness_a, roughness_b, correlation, drift_a, drift_b = _metrics_kernel(
+                np.ascontiguousarray(rtneo_results.positions, dtype=np.float64),
+                np.ascontiguousarray(rtcneo_results.positions, dtype=np.float64),
+                np.ascontiguousarray(rtneo_results.energies, dtype=np.float64),
+                np.ascontiguousarray(rtcneo_results.energies, dtype=np.float64),
+                dt,
+                stride
+            )
+            return {
+                'smoothness_ratio': (roughness_a / roughness_b
+                                     if roughness_b > 0 else float('inf')),
+                'final_position_diff': final_position_diff,
+                'trajectory_correlation': correlation,
+                'energy_drift': {
+                    'rtneo_drift': drift_a,
+                    'rtcneo_drift': drift_b,
+                    'drift_ratio': drift_a / drift_b if drift_b > 0 else float('inf')
+                }
+            }
+
+        positions = np.stack([rtneo_results.positions, rtcneo_results.positions])
+
+        # Smoothness: std of acceleration (second derivative of position)
+        roughness = np.diff(positions, n=2, axis=1).std(axis=1) / (dt * dt)
+        smoothness_ratio = (roughness[0] / roughness[1]
+                            if roughness[1] > 0 else float('inf'))
+
+        # Pearson correlation from the centered (strided) trajectories
+        strided = positions[:, ::stride]
+        centered = strided - strided.mean(axis=1, keepdims=True)
+        correlation = (np.dot(centered[0], centered[1])
+                       / np.sqrt(np.dot(centered[0], centered[0])
+                                 * np.dot(centered[1], centered[1])))
+
+        # Energy drift: relative standard deviation of each energy trace (same
+        # shifted one-pass moments as calculate_energy_drift_comparison)
+        drift = (_relative_drift(rtneo_energies), _relative_drift(rtcneo_energies))
+
+        return {
+            'smoothness_ratio': float(smoothness_ratio),
+            'final_position_diff': final_position_diff,
+            'trajectory_correlation': float(correlation),
+            'energy_drift': {
+                'rtneo_drift': float(drift[0]),
+                'rtcneo_drift': float(drift[1]),
+                'drift_ratio': (float(drift[0] / drift[1])
+                                if drift[1] > 0 else float('inf'))
+            }
+        }
+
 
 class ComparisonPlotter:
     """Create publication-quality comparison plots."""
@@ -88,7 +255,9 @@ class ComparisonPlotter:
     @staticmethod
     def plot_full_comparison(rtneo_results: SimulationResults,
                             rtcneo_results: SimulationResults,
-                            save_path: Optional[str] = None) -> plt.Figure:
+                            save_path: Optional[str] = None,
+                            dpi: int = 300,
+                            max_points: int = 4000) -> 'Figure':
         """
         Create comprehensive 4-panel comparison plot.
 
@@ -97,15 +266,28 @@ class ComparisonPlotter:
         2. Energy evolution
         3. Velocity comparison
         4. Phase space (position vs velocity)
+
+        Trajectories longer than max_points are strided before plotting, so
+        rendering cost does not grow with the number of time steps.
         """
+        plt = _plt()
         fig, axes = plt.subplots(2, 2, figsize=(14, 10))
 
+        # Downsample for plotting only (metrics always use the full trajectories)
+        stride = max(1, len(rtneo_results.times) // max_points)
+        rtneo_times = rtneo_results.times[::stride]
+        rtneo_positions = rtneo_results.positions[::stride]
+        rtneo_energies = rtneo_results.energies[::stride]
+        rtcneo_times = rtcneo_results.times[::stride]
+        rtcneo_positions = rtcneo_results.positions[::stride]
+        rtcneo_energies = rtcneo_results.energies[::stride]
+
         # Panel 1: Position trajectories
         ax1 = axes[0, 0]
-        ax1.plot(rtneo_results.times, rtneo_results.positions,
-                'r-', alpha=0.7, linewidth=1.5, label='RT-NEO (quantum)')
-        ax1.plot(rtcneo_results.times, rtcneo_results.positions,
-                'b-', linewidth=2, label='RT-cNEO (constrained)')
+        ax1.plot(rtneo_times, rtneo_positions,
+                'r-', alpha=0.7, linewidth=1.5, label='RT-NEO (quantum)', rasterized=True)
+        ax1.plot(rtcneo_times, rtcneo_positions,
+                'b-', linewidth=2, label='RT-cNEO (constrained)', rasterized=True)
         ax1.axhline(y=0, color='k', linestyle='--', alpha=0.3)
         ax1.axhline(y=0.3, color='g', linestyle=':', alpha=0.3, label='Transfer threshold')
         ax1.set_xlabel('Time (au)', fontsize=11)
@@ -116,12 +298,15 @@ class ComparisonPlotter:
 
         # Panel 2: Energy evolution
         ax2 = axes[0, 1]
-        rtneo_e0 = rtneo_results.energies[0]
-        rtcneo_e0 = rtcneo_results.energies[0]
-        ax2.plot(rtneo_results.times, (rtneo_results.energies - rtneo_e0) * 27.2114,
-                'r-', alpha=0.7, linewidth=1.5, label='RT-NEO')
-        ax2.plot(rtcneo_results.times, (rtcneo_results.energies - rtcneo_e0) * 27.2114,
-                'b-', linewidth=2, label='RT-cNEO')
+        # Energy change in eV: one allocation per trace, scaled in place
+        rtneo_energy_change = rtneo_energies - rtneo_results.energies[0]
+        rtneo_energy_change *= PhysicalConstants.HARTREE_TO_EV
+        rtcneo_energy_change = rtcneo_energies - rtcneo_results.energies[0]
+        rtcneo_energy_change *= PhysicalConstants.HARTREE_TO_EV
+        ax2.plot(rtneo_times, rtneo_energy_change,
+                'r-', alpha=0.7, linewidth=1.5, label='RT-NEO', rasterized=True)
+        ax2.plot(rtcneo_times, rtcneo_energy_change,
+                'b-', linewidth=2, label='RT-cNEO', rasterized=True)
         ax2.set_xlabel('Time (au)', fontsize=11)
         ax2.set_ylabel('Energy Change (eV)', fontsize=11)
         ax2.set_title('Energy Conservation', fontsize=12, fontweight='bold')
@@ -131,12 +316,14 @@ class ComparisonPlotter:
         # Panel 3: Velocity comparison
         ax3 = axes[1, 0]
         dt = rtneo_results.times[1] - rtneo_results.times[0]
-        rtneo_vel = np.diff(rtneo_results.positions) / dt
-        rtcneo_vel = np.diff(rtcneo_results.positions) / dt
-        time_vel = rtneo_results.times[:-1]
-
-        ax3.plot(time_vel, rtneo_vel, 'r-', alpha=0.7, linewidth=1.5, label='RT-NEO')
-        ax3.plot(time_vel, rtcneo_vel, 'b-', linewidth=2, label='RT-cNEO')
+        rtneo_vel = np.diff(rtneo_positions) / (dt * stride)
+        rtcneo_vel = np.diff(rtcneo_positions) / (dt * stride)
+        time_vel = rtneo_times[:-1]
+
+        ax3.plot(time_vel, rtneo_vel, 'r-', alpha=0.7, linewidth=1.5, label='RT-NEO',
+                 rasterized=True)
+        ax3.plot(time_vel, rtcneo_vel, 'b-', linewidth=2, label='RT-cNEO',
+                 rasterized=True)
         ax3.axhline(y=0, color='k', linestyle='--', alpha=0.3)
         ax3.set_xlabel('Time (au)', fontsize=11)
         ax3.set_ylabel('Velocity (Å/au)', fontsize=11)
@@ -146,10 +333,10 @@ class ComparisonPlotter:
 
         # Panel 4: Phase space
         ax4 = axes[1, 1]
-        ax4.plot(rtneo_results.positions[:-1], rtneo_vel,
-                'r-', alpha=0.5, linewidth=1, label='RT-NEO')
-        ax4.plot(rtcneo_results.positions[:-1], rtcneo_vel,
-                'b-', linewidth=1.5, label='RT-cNEO')
+        ax4.plot(rtneo_positions[:-1], rtneo_vel,
+                'r-', alpha=0.5, linewidth=1, label='RT-NEO', rasterized=True)
+        ax4.plot(rtcneo_positions[:-1], rtcneo_vel,
+                'b-', linewidth=1.5, label='RT-cNEO', rasterized=True)
         ax4.axvline(x=0, color='k', linestyle='--', alpha=0.3)
         ax4.axhline(y=0, color='k', linestyle='--', alpha=0.3)
         ax4.set_xlabel('Position (Å)', fontsize=11)
@@ -161,21 +348,26 @@ class ComparisonPlotter:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
             print(f"Comparison plot saved to: {save_path}")
 
         return fig
 
     @staticmethod
     def plot_constraint_analysis(rtcneo_results: SimulationResults,
-                                 save_path: Optional[str] = None) -> plt.Figure:
+                                 save_path: Optional[str] = None,
+                                 dpi: int = 300) -> 'Figure':
         """Create detailed analysis of constraint forces in RT-cNEO."""
+        plt = _plt()
         fig, axes = plt.subplots(2, 1, figsize=(12, 8))
 
+        # Constraint force in units of 10⁻³ au, shared by both panels
+        constraint_forces_scaled = rtcneo_results.constraint_forces * 1000.0
+
         # Panel 1: Constraint force over time
         ax1 = axes[0]
-        ax1.plot(rtcneo_results.times, rtcneo_results.constraint_forces * 1000,
-                'g-', linewidth=1.5)
+        ax1.plot(rtcneo_results.times, constraint_forces_scaled,
+                'g-', linewidth=1.5, rasterized=True)
         ax1.axhline(y=0, color='k', linestyle='--', alpha=0.3)
         ax1.set_xlabel('Time (au)', fontsize=11)
         ax1.set_ylabel('Constraint Force (×10⁻³ au)', fontsize=11)
@@ -184,8 +376,9 @@ class ComparisonPlotter:
 
         # Panel 2: Constraint force vs position
         ax2 = axes[1]
-        scatter = ax2.scatter(rtcneo_results.positions, rtcneo_results.constraint_forces * 1000,
-                             c=rtcneo_results.times, cmap='viridis', s=10, alpha=0.6)
+        scatter = ax2.scatter(rtcneo_results.positions, constraint_forces_scaled,
+                             c=rtcneo_results.times, cmap='viridis', s=10, alpha=0.6,
+                             rasterized=True)
         ax2.axhline(y=0, color='k', linestyle='--', alpha=0.3)
         ax2.axvline(x=0, color='k', linestyle='--', alpha=0.3)
         ax2.set_xlabel('Position (Å)', fontsize=11)
@@ -198,7 +391,7 @@ class ComparisonPlotter:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
             print(f"Constraint analysis plot saved to: {save_path}")
 
         return fig
@@ -222,8 +415,11 @@ class ComparisonStudy:
             field_strategy: Optional custom field strategy
             potential_strategy: Optional custom potential strategy
         """
-        if not RTCNEO_AVAILABLE:
-            raise ImportError("rt_cneo_clean module not available")
+        try:
+            backend = _load_rt_cneo_clean()
+        except ImportError as exc:
+            raise ImportError("rt_cneo_clean module not available") from exc
+        self._trajectory_analyzer_class = backend.TrajectoryAnalyzer
 
         self.parameters = parameters
         self.field_strategy = field_strategy
@@ -232,11 +428,23 @@ class ComparisonStudy:
         self.rtneo_results = None
         self.rtcneo_results = None
         self.metrics = None
+        self._out_buf = None  # Reusable float64 (N, 4) buffer for CSV output
+        self._analyses = None  # Cached TrajectoryAnalyzer output (rtneo, rtcneo)
 
-    def run_full_comparison(self, verbose: bool = True) -> Tuple[SimulationResults, SimulationResults]:
+    def run_full_comparison(self, verbose: bool = True,
+                            parallel: bool = False) -> Tuple[SimulationResults, SimulationResults]:
         """
         Run both RT-NEO and RT-cNEO simulations.
 
+        Args:
+            verbose: Print progress banners
+            parallel: Run the two simulations concurrently in separate processes
+                (default: False). Each worker builds its own simulator, so system
+                setup runs twice. Strategies must be picklable; PySCF-backed ones
+                (e.g. PySCFGradientPotential) are not, and then the serial path
+                is used. On spawn platforms (macOS, Windows) the calling script
+                needs an ``if __name__ == '__main__':`` guard.
+
         Returns:
             (rtneo_results, rtcneo_results)
         """
@@ -245,26 +453,45 @@ class ComparisonStudy:
             print(" RT-NEO vs RT-cNEO COMPARISON STUDY")
             print("="*80)
 
-        # Create simulator
-        simulator = SimulationFactory.create_simulator(
-            parameters=self.parameters,
-            field_strategy=self.field_strategy,
-            potential_strategy=self.potential_strategy,
-            use_simplified=False
-        )
-
-        # Run RT-NEO
-        if verbose:
-            print("\n[1/2] Running RT-NEO (pure quantum dynamics)...")
-        self.rtneo_results = simulator.run_rtneo()
-
-        # Run RT-cNEO
-        if verbose:
-            print("\n[2/2] Running RT-cNEO (constrained dynamics)...")
-        self.rtcneo_results = simulator.run_rtcneo()
+        strategy_args = (self.parameters, self.field_strategy, self.potential_strategy)
+
+        if parallel:
+            try:
+                pickle.dumps(strategy_args)
+            except Exception as exc:
+                if verbose:
+                    print(f"\n[INFO] Strategies cannot be sent to worker processes "
+                          f"({type(exc).__name__}); running serially")
+                parallel = False
+
+        if parallel:
+            if verbose:
+                print("\nRunning RT-NEO and RT-cNEO in parallel (2 processes)...")
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                rtneo_future = executor.submit(_run_rtneo, *strategy_args)
+                rtcneo_future = executor.submit(_run_rtcneo, *strategy_args)
+                self.rtneo_results = rtneo_future.result()
+                self.rtcneo_results = rtcneo_future.result()
+        else:
+            simulator = _create_simulator(*strategy_args)
+
+            # Run RT-NEO
+            if verbose:
+                print("\n[1/2] Running RT-NEO (pure quantum dynamics)...")
+            self.rtneo_results = simulator.run_rtneo()
+
+            # Run RT-cNEO
+            if verbose:
+                print("\n[2/2] Running RT-cNEO (constrained dynamics)...")
+            self.rtcneo_results = simulator.run_rtcneo()
+
+        # Normalize once so downstream kernels never copy
+        _ensure_contiguous(self.rtneo_results)
+        _ensure_contiguous(self.rtcneo_results)
 
         # Calculate metrics
         self.metrics = self._calculate_all_metrics()
+        self._analyses = None
 
         if verbose:
             print("\n" + "="*80)
@@ -273,72 +500,67 @@ class ComparisonStudy:
 
         return self.rtneo_results, self.rtcneo_results
 
-    def _calculate_all_metrics(self) -> Dict:
-        """Calculate all comparison metrics."""
+    def _calculate_all_metrics(self, stride: int = 1) -> Dict:
+        """Calculate all comparison metrics (stride applies to correlation and drift)."""
         if self.rtneo_results is None or self.rtcneo_results is None:
             raise RuntimeError("Must run simulations before calculating metrics")
 
-        return {
-            'smoothness_ratio': ComparisonMetrics.calculate_smoothness_ratio(
-                self.rtneo_results, self.rtcneo_results
-            ),
-            'final_position_diff': ComparisonMetrics.calculate_final_position_difference(
-                self.rtneo_results, self.rtcneo_results
-            ),
-            'trajectory_correlation': ComparisonMetrics.calculate_trajectory_correlation(
-                self.rtneo_results, self.rtcneo_results
-            ),
-            'energy_drift': ComparisonMetrics.calculate_energy_drift_comparison(
-                self.rtneo_results, self.rtcneo_results
-            ),
-            'rtneo_crossings': self.rtneo_results.count_barrier_crossings(),
-            'rtcneo_crossings': self.rtcneo_results.count_barrier_crossings(),
-        }
+        metrics = ComparisonMetrics.calculate_all_metrics(
+            self.rtneo_results, self.rtcneo_results, stride=stride
+        )
+        metrics['rtneo_crossings'] = self.rtneo_results.count_barrier_crossings()
+        metrics['rtcneo_crossings'] = self.rtcneo_results.count_barrier_crossings()
+        return metrics
+
+    def _get_analyses(self) -> Tuple[Dict, Dict]:
+        """Return (rtneo, rtcneo) trajectory analyses, computing them once per run."""
+        if self._analyses is None:
+            analyzer = self._trajectory_analyzer_class()
+            self._analyses = (analyzer.analyze(self.rtneo_results),
+                              analyzer.analyze(self.rtcneo_results))
+        return self._analyses
 
     def print_summary(self) -> None:
         """Print comprehensive comparison summary."""
         if self.metrics is None:
             raise RuntimeError("Must run comparison before printing summary")
 
-        print("\n" + "="*80)
-        print(" COMPARISON SUMMARY")
-        print("="*80)
-
-        # Final positions
-        print("\nFinal Positions:")
-        print(f"  RT-NEO:  {self.rtneo_results.get_final_position():7.3f} Å")
-        print(f"  RT-cNEO: {self.rtcneo_results.get_final_position():7.3f} Å")
-        print(f"  Difference: {self.metrics['final_position_diff']:.3f} Å")
-
-        # Transfer assessment
-        print("\nTransfer Assessment:")
-        analyzer = TrajectoryAnalyzer()
-        rtneo_analysis = analyzer.analyze(self.rtneo_results)
-        rtcneo_analysis = analyzer.analyze(self.rtcneo_results)
-        print(f"  RT-NEO:  {rtneo_analysis['transfer_assessment']}")
-        print(f"  RT-cNEO: {rtcneo_analysis['transfer_assessment']}")
-
-        # Smoothness
-        print("\nTrajectory Smoothness:")
-        print(f"  RT-cNEO is {self.metrics['smoothness_ratio']:.2f}× smoother than RT-NEO")
-
-        # Barrier crossings
-        print("\nBarrier Crossings:")
-        print(f"  RT-NEO:  {self.metrics['rtneo_crossings']} crossings")
-        print(f"  RT-cNEO: {self.metrics['rtcneo_crossings']} crossings")
-
-        # Correlation
-        print("\nTrajectory Correlation:")
-        print(f"  Pearson r = {self.metrics['trajectory_correlation']:.4f}")
-
-        # Energy conservation
-        print("\nEnergy Conservation:")
-        print(f"  RT-NEO drift:  {self.metrics['energy_drift']['rtneo_drift']:.2e}")
-        print(f"  RT-cNEO drift: {self.metrics['energy_drift']['rtcneo_drift']:.2e}")
-
-        print("="*80)
-
-    def generate_report(self, output_dir: str = "comparison_results") -> None:
+        rtneo_analysis, rtcneo_analysis = self._get_analyses()
+        energy_drift = self.metrics['energy_drift']
+
+        # Single write keeps the summary contiguous in logs shared with workers
+        print(f"""
+{"="*80}
+ COMPARISON SUMMARY
+{"="*80}
+
+Final Positions:
+  RT-NEO:  {self.rtneo_results.get_final_position():7.3f} Å
+  RT-cNEO: {self.rtcneo_results.get_final_position():7.3f} Å
+  Difference: {self.metrics['final_position_diff']:.3f} Å
+
+Transfer Assessment:
+  RT-NEO:  {rtneo_analysis['transfer_assessment']}
+  RT-cNEO: {rtcneo_analysis['transfer_assessment']}
+
+Trajectory Smoothness:
+  RT-cNEO is {self.metrics['smoothness_ratio']:.2f}× smoother than RT-NEO
+
+Barrier Crossings:
+  RT-NEO:  {self.metrics['rtneo_crossings']} crossings
+  RT-cNEO: {self.metrics['rtcneo_crossings']} crossings
+
+Trajectory Correlation:
+  Pearson r = {self.metrics['trajectory_correlation']:.4f}
+
+Energy Conservation:
+  RT-NEO drift:  {energy_drift['rtneo_drift']:.2e}
+  RT-cNEO drift: {energy_drift['rtcneo_drift']:.2e}
+{"="*80}""")
+
+    def generate_report(self, output_dir: str = "comparison_results",
+                        save_csv: bool = False,
+                        high_dpi: bool = False) -> None:
         """
         Generate comprehensive comparison report with plots and data files.
 
@@ -346,7 +568,13 @@ class ComparisonStudy:
         - Full comparison plot (4 panels)
         - Constraint analysis plot
         - Summary text file
-        - CSV data files for both methods
+        - Compressed NumPy archive (trajectories.npz) with both trajectories
+        - CSV data files for both methods (only if save_csv=True)
+
+        Args:
+            output_dir: Directory for report files
+            save_csv: Also write human-readable CSV trajectories (slow for long runs)
+            high_dpi: Save plots at 300 dpi (publication) instead of 150 dpi
         """
         if self.metrics is None:
             raise RuntimeError("Must run comparison before generating report")
@@ -358,79 +586,116 @@ class ComparisonStudy:
 
         # Generate plots
         plotter = ComparisonPlotter()
+        dpi = 300 if high_dpi else 150
 
         comparison_fig = plotter.plot_full_comparison(
             self.rtneo_results,
             self.rtcneo_results,
-            save_path=str(output_path / "comparison_full.png")
+            save_path=str(output_path / "comparison_full.png"),
+            dpi=dpi
         )
-        plt.close(comparison_fig)
+        _plt().close(comparison_fig)
 
         constraint_fig = plotter.plot_constraint_analysis(
             self.rtcneo_results,
-            save_path=str(output_path / "constraint_analysis.png")
+            save_path=str(output_path / "constraint_analysis.png"),
+            dpi=dpi
+        )
+        _plt().close(constraint_fig)
+
+        # Save data files (binary archive; CSV formatting is opt-in)
+        np.savez_compressed(
+            output_path / "trajectories.npz",
+            rtneo_times=self.rtneo_results.times,
+            rtneo_positions=self.rtneo_results.positions,
+            rtneo_energies=self.rtneo_results.energies,
+            rtcneo_times=self.rtcneo_results.times,
+            rtcneo_positions=self.rtcneo_results.positions,
+            rtcneo_energies=self.rtcneo_results.energies,
+            rtcneo_constraint_forces=self.rtcneo_results.constraint_forces
         )
-        plt.close(constraint_fig)
 
-        # Save data files
+        if save_csv:
+            self._save_csv_trajectories(output_path)
+
+        # Generate text summary (built in memory, written with a single call)
+        lines = [
+            "="*80,
+            " RT-NEO vs RT-cNEO COMPARISON REPORT",
+            "="*80,
+            "",
+            "Simulation Parameters:",
+        ]
+        for key, value in self.parameters.__dict__.items():
+            lines.append(f"  {key:25s}: {value}")
+
+        lines += [
+            "",
+            "-"*80,
+            " RESULTS",
+            "-"*80,
+            "",
+            "Final Positions:",
+            f"  RT-NEO:  {self.rtneo_results.get_final_position():.6f} Å",
+            f"  RT-cNEO: {self.rtcneo_results.get_final_position():.6f} Å",
+            f"  Difference: {self.metrics['final_position_diff']:.6f} Å",
+            "",
+            f"Smoothness Ratio: {self.metrics['smoothness_ratio']:.4f}",
+            f"Trajectory Correlation: {self.metrics['trajectory_correlation']:.4f}",
+            "",
+            "Barrier Crossings:",
+            f"  RT-NEO:  {self.metrics['rtneo_crossings']}",
+            f"  RT-cNEO: {self.metrics['rtcneo_crossings']}",
+            "",
+            "Energy Drift:",
+            f"  RT-NEO:  {self.metrics['energy_drift']['rtneo_drift']:.6e}",
+            f"  RT-cNEO: {self.metrics['energy_drift']['rtcneo_drift']:.6e}",
+        ]
+        (output_path / "comparison_summary.txt").write_text("\n".join(lines) + "\n")
+
+        print(f"✓ Report generated successfully!")
+        print(f"  - comparison_full.png")
+        print(f"  - constraint_analysis.png")
+        print(f"  - comparison_summary.txt")
+        print(f"  - trajectories.npz")
+        if save_csv:
+            print(f"  - rtneo_trajectory.csv")
+            print(f"  - rtcneo_trajectory.csv")
+
+    def _get_output_buffer(self, num_rows: int) -> np.ndarray:
+        """
+        Return the reusable (num_rows, 4) output buffer, reallocating on size change.
+
+        The buffer is float64: float32 does not carry all 7 significant digits
+        printed by %.6e, so narrowing would change the last digit of some values.
+        """
+        if self._out_buf is None or self._out_buf.shape[0] != num_rows:
+            self._out_buf = np.empty((num_rows, 4), dtype=np.float64)
+        return self._out_buf
+
+    def _save_csv_trajectories(self, output_path: Path) -> None:
+        """Write both trajectories as CSV files through a shared column buffer."""
+        rtneo_data = self._get_output_buffer(len(self.rtneo_results.times))[:, :3]
+        rtneo_data[:, 0] = self.rtneo_results.times
+        rtneo_data[:, 1] = self.rtneo_results.positions
+        rtneo_data[:, 2] = self.rtneo_results.energies
         np.savetxt(
             output_path / "rtneo_trajectory.csv",
-            np.column_stack([
-                self.rtneo_results.times,
-                self.rtneo_results.positions,
-                self.rtneo_results.energies
-            ]),
+            rtneo_data,
             header="Time(au), Position(Å), Energy(au)",
             delimiter=",",
             fmt="%.6e"
         )
 
+        rtcneo_data = self._get_output_buffer(len(self.rtcneo_results.times))
+        rtcneo_data[:, 0] = self.rtcneo_results.times
+        rtcneo_data[:, 1] = self.rtcneo_results.positions
+        rtcneo_data[:, 2] = self.rtcneo_results.energies
+        rtcneo_data[:, 3] = self.rtcneo_results.constraint_forces
         np.savetxt(
             output_path / "rtcneo_trajectory.csv",
-            np.column_stack([
-                self.rtcneo_results.times,
-                self.rtcneo_results.positions,
-                self.rtcneo_results.energies,
-                self.rtcneo_results.constraint_forces
-            ]),
+            rtcneo_data,
             header="Time(au), Position(Å), Energy(au), ConstraintForce(au)",
             delimiter=",",
             fmt="%.6e"
         )
-
-        # Generate text summary
-        with open(output_path / "comparison_summary.txt", 'w') as f:
-            f.write("="*80 + "\n")
-            f.write(" RT-NEO vs RT-cNEO COMPARISON REPORT\n")
-            f.write("="*80 + "\n\n")
-
-            f.write("Simulation Parameters:\n")
-            for key, value in self.parameters.__dict__.items():
-                f.write(f"  {key:25s}: {value}\n")
-
-            f.write("\n" + "-"*80 + "\n")
-            f.write(" RESULTS\n")
-            f.write("-"*80 + "\n\n")
-
-            f.write(f"Final Positions:\n")
-            f.write(f"  RT-NEO:  {self.rtneo_results.get_final_position():.6f} Å\n")
-            f.write(f"  RT-cNEO: {self.rtcneo_results.get_final_position():.6f} Å\n")
-            f.write(f"  Difference: {self.metrics['final_position_diff']:.6f} Å\n\n")
-
-            f.write(f"Smoothness Ratio: {self.metrics['smoothness_ratio']:.4f}\n")
-            f.write(f"Trajectory Correlation: {self.metrics['trajectory_correlation']:.4f}\n\n")
-
-            f.write(f"Barrier Crossings:\n")
-            f.write(f"  RT-NEO:  {self.metrics['rtneo_crossings']}\n")
-            f.write(f"  RT-cNEO: {self.metrics['rtcneo_crossings']}\n\n")
-
-            f.write(f"Energy Drift:\n")
-            f.write(f"  RT-NEO:  {self.metrics['energy_drift']['rtneo_drift']:.6e}\n")
-            f.write(f"  RT-cNEO: {self.metrics['energy_drift']['rtcneo_drift']:.6e}\n")
-
-        print(f"✓ Report generated successfully!")
-        print(f"  - comparison_full.png")
-        print(f"  - constraint_analysis.png")
-        print(f"  - comparison_summary.txt")
-        print(f"  - rtneo_trajectory.csv")
-        print(f"  - rtcneo_trajectory.csv")
@@ -6,7 +6,8 @@ Follows Clean Code principles with clear, descriptive names.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 import numpy as np
 
 
@@ -20,9 +21,14 @@ class PhysicalConstants:
     FEMTOSECOND_TO_AU = 41.341
 
 
-@dataclass
+@dataclass(frozen=True)
 class PotentialParameters:
-    """Parameters for FHF- double-well potential."""
+    """
+    Parameters for FHF- double-well potential.
+
+    Frozen: DoubleWellPotential precomputes force prefactors from these values,
+    so change them by assigning a new instance (e.g. dataclasses.replace).
+    """
     quartic_coefficient: float = 0.1      # Coefficient for x^4 term
     quadratic_coefficient: float = 0.05   # Coefficient for x^2 term
     barrier_height: float = 0.02          # Gaussian barrier height
@@ -62,20 +68,55 @@ class SimulationParameters:
     convergence_threshold: float = 1e-8
     max_scf_cycles: int = 100
     use_time_dependent_fock: bool = False  # Enable time-dependent Fock (expensive!)
+    verbosity: int = 0  # PySCF log level (0 = silent, 4 = full SCF output)
 
 
-@dataclass
 class DynamicsState:
-    """Represents the current state in dynamics simulation."""
-    time: float
-    electronic_density: np.ndarray
-    nuclear_density: np.ndarray
-    position: float
-    energy: float
-    constraint_force: float = 0.0
+    """
+    Represents the current state in dynamics simulation.
+
+    Scalars describe a single time step; per-step trajectories are collected
+    separately into SimulationResults as one array per quantity.
+
+    Uses __slots__ (no per-instance dict) since a state is snapshotted every step.
+    Snapshots that are only read should use shallow_copy(), which shares the
+    density matrices; use deep_copy() when either copy's densities will be
+    modified in place.
+    """
+    __slots__ = ('time', 'electronic_density', 'nuclear_density',
+                 'position', 'energy', 'constraint_force')
+
+    def __init__(self,
+                 time: float,
+                 electronic_density: np.ndarray,
+                 nuclear_density: np.ndarray,
+                 position: float,
+                 energy: float,
+                 constraint_force: float = 0.0):
+        self.time = time
+        self.electronic_density = electronic_density
+        self.nuclear_density = nuclear_density
+        self.position = position
+        self.energy = energy
+        self.constraint_force = constraint_force
+
+    def __repr__(self) -> str:
+        return (f"DynamicsState(time={self.time!r}, position={self.position!r}, "
+                f"energy={self.energy!r}, constraint_force={self.constraint_force!r})")
+
+    def shallow_copy(self) -> 'DynamicsState':
+        """Create a copy that shares (aliases) the density matrices."""
+        return DynamicsState(
+            time=self.time,
+            electronic_density=self.electronic_density,
+            nuclear_density=self.nuclear_density,
+            position=self.position,
+            energy=self.energy,
+            constraint_force=self.constraint_force
+        )
 
-    def copy(self) -> 'DynamicsState':
-        """Create a deep copy of the state."""
+    def deep_copy(self) -> 'DynamicsState':
+        """Create a copy with its own density matrices."""
         return DynamicsState(
             time=self.time,
             electronic_density=self.electronic_density.copy(),
@@ -85,16 +126,60 @@ class DynamicsState:
             constraint_force=self.constraint_force
         )
 
+    def copy(self) -> 'DynamicsState':
+        """Create a deep copy of the state (same as deep_copy)."""
+        return self.deep_copy()
+
 
 @dataclass
 class SimulationResults:
-    """Container for simulation results."""
+    """
+    Container for simulation results.
+
+    Trajectories are stored structure-of-arrays: times, positions, energies and
+    constraint_forces are separate 1D C-contiguous float64 arrays of equal length
+    (one entry per time step). Analysis code relies on this layout to avoid copies.
+
+    Use allocate() with memmap_dir to back the arrays by files on disk, so memory
+    use scales with the pages in use rather than with trajectory length.
+    """
     method: str
     times: np.ndarray
     positions: np.ndarray
     energies: np.ndarray
     constraint_forces: np.ndarray
     convergence_info: Dict = field(default_factory=dict)
+    memmap_dir: Optional[str] = None
+
+    @classmethod
+    def allocate(cls, method: str, num_steps: int,
+                 memmap_dir: Optional[str] = None) -> 'SimulationResults':
+        """
+        Create zero-filled result arrays for a run of num_steps time steps.
+
+        Args:
+            method: Method label (e.g. 'RT-NEO'), also used as file name prefix
+            num_steps: Number of stored time steps
+            memmap_dir: If given, back each array by a float64 np.memmap file
+                '<method>_<quantity>.f64' in this directory
+        """
+        def new_array(quantity: str) -> np.ndarray:
+            if memmap_dir is None:
+                return np.zeros(num_steps, dtype=np.float64)
+            path = Path(memmap_dir) / f"{method}_{quantity}.f64"
+            return np.memmap(path, dtype=np.float64, mode='w+', shape=(num_steps,))
+
+        if memmap_dir is not None:
+            Path(memmap_dir).mkdir(parents=True, exist_ok=True)
+
+        return cls(
+            method=method,
+            times=new_array('times'),
+            positions=new_array('positions'),
+            energies=new_array('energies'),
+            constraint_forces=new_array('constraint_forces'),
+            memmap_dir=memmap_dir
+        )
 
     def get_final_position(self) -> float:
         """Get final proton position."""
@@ -102,8 +187,26 @@ class SimulationResults:
 
     def get_max_displacement(self) -> float:
         """Get maximum displacement from origin."""
-        return np.max(np.abs(self.positions))
+        # Two allocation-free reductions instead of materializing |positions|
+        positions = self.positions
+        return max(positions.max(), -positions.min())
 
     def count_barrier_crossings(self) -> int:
-        """Count number of times proton crosses x=0."""
-        return np.sum(np.diff(np.sign(self.positions)) != 0)
+        """
+        Count number of times proton crosses x=0.
+
+        For float positions, compares IEEE-754 sign bits of consecutive values:
+        the XOR of the same-width integer bit patterns is negative exactly when
+        the sign bit flips. Other dtypes compare against zero directly. Exact
+        zeros count as positive (the sign of -0.0 is negative).
+        """
+        positions = np.asarray(self.positions)
+        if positions.dtype.kind == 'f':
+            if positions.dtype != np.float32:
+                positions = positions.astype(np.float64, copy=False)
+            bits = np.ascontiguousarray(positions).view(
+                np.int32 if positions.dtype == np.float32 else np.int64)
+            return int(np.count_nonzero((bits[1:] ^ bits[:-1]) < 0))
+
+        negative = positions < 0
+        return int(np.count_nonzero(negative[1:] ^ negative[:-1]))
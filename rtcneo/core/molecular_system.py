@@ -4,16 +4,62 @@ Molecular system definitions for RT-cNEO.
 Currently implements FHF- (bifluoride anion) with quantum proton.
 """
 
-from typing import Optional
+import functools
+from typing import Optional, Tuple
 from .constants import SimulationParameters
 
-# PySCF imports - handled by environment setup
-try:
-    from pyscf import gto
-    PYSCF_AVAILABLE = True
-except ImportError:
-    PYSCF_AVAILABLE = False
-    gto = None
+
+# pyscf.gto module once imported, or the ImportError from the failed attempt
+_gto = None
+_gto_import_error: Optional[ImportError] = None
+
+
+def _get_gto():
+    """
+    Import pyscf.gto on first use (environment setup must already have run).
+
+    PySCF takes seconds to import, so simplified-mode runs that never build a
+    molecule skip it. Raises ImportError if PySCF is not installed; the failure
+    is remembered, so later calls do not retry the import.
+    """
+    global _gto, _gto_import_error
+    if _gto is None:
+        if _gto_import_error is not None:
+            raise ImportError("PySCF is not available") from _gto_import_error
+        try:
+            from pyscf import gto
+        except ImportError as exc:
+            _gto_import_error = exc
+            raise
+        _gto = gto
+    return _gto
+
+
+@functools.lru_cache(maxsize=32)
+def _build_mole_cached(atoms: Tuple[str, ...], basis: str, charge: int, spin: int,
+                       verbose: int = 0):
+    """
+    Build a PySCF Mole once per (atoms, basis, charge, spin, verbose) combination.
+
+    Basis parsing dominates Mole.build() for small systems, so repeated
+    MolecularSystem constructions (parameter sweeps, restarts) reuse the result.
+    Callers must not mutate the returned object; use _build_mole() for a copy.
+    """
+    mol = _get_gto().Mole()
+    mol.atom = list(atoms)
+    mol.basis = basis
+    mol.charge = charge
+    mol.spin = spin
+    mol.unit = 'angstrom'
+    mol.verbose = verbose
+    mol.build()
+    return mol
+
+
+def _build_mole(atoms: Tuple[str, ...], basis: str, charge: int, spin: int,
+                verbose: int = 0):
+    """Return a private copy of the cached Mole (downstream code may modify it)."""
+    return _build_mole_cached(atoms, basis, charge, spin, verbose).copy()
 
 
 class MolecularSystem:
@@ -47,24 +93,25 @@ class MolecularSystem:
 
     def _build_molecule(self) -> None:
         """Build PySCF molecule object."""
-        if not PYSCF_AVAILABLE or gto is None:
+        try:
+            _get_gto()
+        except ImportError:
             print("[INFO] Simplified mode: Skipping PySCF molecule build")
             self.mol = None
             return
 
-        self.mol = gto.Mole()
-
         # Combine all nuclei
         all_atoms = self.classical_nuclei + self.quantum_nuclei
-        self.mol.atom = [f'{atom} {x:.6f} {y:.6f} {z:.6f}'
-                        for atom, x, y, z in all_atoms]
-
-        self.mol.basis = self.parameters.basis_set
-        self.mol.charge = -1  # FHF- anion
-        self.mol.spin = 0     # Closed shell
-        self.mol.unit = 'angstrom'
-        self.mol.verbose = 4
-        self.mol.build()
+        atoms = tuple(f'{atom} {x:.6f} {y:.6f} {z:.6f}'
+                      for atom, x, y, z in all_atoms)
+
+        self.mol = _build_mole(
+            atoms,
+            self.parameters.basis_set,
+            -1,  # FHF- anion
+            0,   # Closed shell
+            self.parameters.verbosity  # PySCF log level, inherited by SCF objects
+        )
 
         self._validate_electron_count()
 
@@ -5,7 +5,8 @@ Implements exponential smoothing and constraint force calculation following
 the RT-cNEO formalism.
 """
 
-from typing import Optional, List, Tuple
+import math
+from typing import Optional, Tuple
 import numpy as np
 
 from .potentials import PotentialStrategy
@@ -23,6 +24,12 @@ class ForceSmoother:
         self.smoothing_time = smoothing_time
         self.previous_smoothed_force: Optional[float] = None
 
+        # Decay factor cache: time_step is constant in a run, so exp() is taken once
+        self._cached_time_step: Optional[float] = None
+        self._cached_smoothing_time: Optional[float] = None
+        self._decay_factor = 0.0
+        self._one_minus_decay = 1.0
+
     def smooth(self, current_force: float, time_step: float) -> float:
         """
         Apply exponential smoothing to force.
@@ -33,9 +40,14 @@ class ForceSmoother:
         if self.previous_smoothed_force is None:
             smoothed_force = current_force
         else:
-            decay_factor = np.exp(-time_step / self.smoothing_time)
-            smoothed_force = (decay_factor * self.previous_smoothed_force
-                            + (1 - decay_factor) * current_force)
+            if (time_step != self._cached_time_step
+                    or self.smoothing_time != self._cached_smoothing_time):
+                self._decay_factor = math.exp(-time_step / self.smoothing_time)
+                self._one_minus_decay = 1.0 - self._decay_factor
+                self._cached_time_step = time_step
+                self._cached_smoothing_time = self.smoothing_time
+            smoothed_force = (self._decay_factor * self.previous_smoothed_force
+                            + self._one_minus_decay * current_force)
 
         self.previous_smoothed_force = smoothed_force
         return smoothed_force
@@ -50,25 +62,58 @@ class ForceHistory:
     Manages history of force values.
 
     Separated from smoothing following Single Responsibility Principle.
+
+    Values live in a preallocated float64 ring buffer, so appends do not
+    allocate and mean()/std() run as NumPy reductions.
     """
 
     def __init__(self, max_size: int = DynamicsConstants.MAX_FORCE_HISTORY):
-        self.max_size = max_size
-        self.history: List[float] = []
+        if max_size < 0:
+            raise ValueError(f"max_size must be non-negative, got {max_size}")
+        self.max_size = max_size  # 0 disables tracking
+        # Ring buffer: _head is the next write slot, _n the number of stored values
+        self._buf = np.empty(max_size, dtype=np.float64)
+        self._n = 0
+        self._head = 0
+
+    @property
+    def history(self) -> np.ndarray:
+        """All stored force values, oldest first (a copy)."""
+        return self.get_recent(self._n)
+
+    def __len__(self) -> int:
+        return self._n
 
     def append(self, force: float) -> None:
-        """Add force to history, maintaining max size."""
-        self.history.append(force)
-        if len(self.history) > self.max_size:
-            self.history.pop(0)
-
-    def get_recent(self, count: int) -> List[float]:
-        """Get most recent force values."""
-        return self.history[-count:] if len(self.history) >= count else self.history
+        """Add force to history, overwriting the oldest value when full."""
+        if self.max_size == 0:
+            return
+        self._buf[self._head] = force
+        self._head = (self._head + 1) % self.max_size
+        if self._n < self.max_size:
+            self._n += 1
+
+    def get_recent(self, count: int) -> np.ndarray:
+        """Get most recent force values, oldest first (a copy)."""
+        count = min(max(count, 0), self._n)
+        start = self._head - count
+        if start >= 0:
+            return self._buf[start:self._head].copy()
+        return np.concatenate((self._buf[start:], self._buf[:self._head]))
+
+    def mean(self) -> float:
+        """Mean of stored force values."""
+        # Stored values always occupy _buf[:_n]; order does not matter here
+        return float(self._buf[:self._n].mean())
+
+    def std(self) -> float:
+        """Standard deviation of stored force values."""
+        return float(self._buf[:self._n].std())
 
     def clear(self) -> None:
         """Clear history."""
-        self.history.clear()
+        self._n = 0
+        self._head = 0
 
 
 class ConstraintForceCalculator:
@@ -87,7 +132,7 @@ class ConstraintForceCalculator:
                  force_history: Optional[ForceHistory] = None):
         self.potential = potential_strategy
         self.smoother = force_smoother
-        self.history = force_history or ForceHistory()
+        self.history = force_history if force_history is not None else ForceHistory()
 
     def calculate_constraint_force(self,
                                    position: float,
@@ -5,8 +5,8 @@ Implements Strategy pattern for different time-dependent external fields.
 Follows Open/Closed Principle: easy to add new field types without modifying existing code.
 """
 
+import math
 from abc import ABC, abstractmethod
-import numpy as np
 
 
 class FieldStrategy(ABC):
@@ -33,32 +33,47 @@ class ConstantField(FieldStrategy):
         return self.strength
 
 
-class LinearRampField(FieldStrategy):
-    """Linear ramp to final field strength."""
+class _RampField(FieldStrategy):
+    """
+    Shared ramp_time handling for ramped fields.
+
+    1/ramp_time is precomputed whenever ramp_time is set. A ramp_time of zero or
+    less means instant switch-on, encoded as an inverse of 0.
+    """
 
     def __init__(self, ramp_time: float, final_strength: float):
         self.ramp_time = ramp_time
         self.final_strength = final_strength
 
+    @property
+    def ramp_time(self) -> float:
+        return self._ramp_time
+
+    @ramp_time.setter
+    def ramp_time(self, value: float) -> None:
+        self._ramp_time = value
+        self._inv_ramp_time = 1.0 / value if value > 0 else 0.0
+
+    def _ramp_fraction(self, time: float) -> float:
+        """Fraction of the ramp completed at time, clamped to [0, 1] for time >= 0."""
+        # 1 - (remaining ramp time) / ramp_time
+        return 1.0 - max(self._ramp_time - time, 0.0) * self._inv_ramp_time
+
+
+class LinearRampField(_RampField):
+    """Linear ramp to final field strength."""
+
     def calculate_field(self, time: float) -> float:
-        """Linear interpolation from 0 to final_strength."""
-        if time < self.ramp_time:
-            return self.final_strength * time / self.ramp_time
-        return self.final_strength
+        """Linear interpolation from 0 to final_strength (clamped at ramp_time)."""
+        return self.final_strength * self._ramp_fraction(time)
 
 
-class CosineRampField(FieldStrategy):
+class CosineRampField(_RampField):
     """Smooth cosine ramp to final field strength."""
 
-    def __init__(self, ramp_time: float, final_strength: float):
-        self.ramp_time = ramp_time
-        self.final_strength = final_strength
-
     def calculate_field(self, time: float) -> float:
-        """Smooth cosine interpolation from 0 to final_strength."""
-        if time < self.ramp_time:
-            return self.final_strength * (1 - np.cos(np.pi * time / self.ramp_time)) / 2
-        return self.final_strength
+        """Smooth cosine interpolation from 0 to final_strength (clamped at ramp_time)."""
+        return self.final_strength * (1 - math.cos(math.pi * self._ramp_fraction(time))) / 2
 
 
 class GaussianPulseField(FieldStrategy):
@@ -76,7 +91,7 @@ class GaussianPulseField(FieldStrategy):
 
     def calculate_field(self, time: float) -> float:
         """Gaussian pulse: A * exp(-((t-t0)/σ)^2)."""
-        return self.amplitude * np.exp(-((time - self.center) / self.width)**2)
+        return self.amplitude * math.exp(-((time - self.center) / self.width)**2)
 
 
 class PulsedField(FieldStrategy):
@@ -89,6 +104,5 @@ class PulsedField(FieldStrategy):
 
     def calculate_field(self, time: float) -> float:
         """Return strength during pulse window, zero otherwise."""
-        if self.turn_on_time <= time <= self.turn_off_time:
-            return self.strength
-        return 0.0
+        # Boolean window mask multiplies as 0/1
+        return self.strength * (self.turn_on_time <= time <= self.turn_off_time)
@@ -4,11 +4,14 @@ Potential energy surface strategies for RT-cNEO.
 Implements Strategy pattern for different PES calculations.
 """
 
+import math
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Dict, Optional
 import numpy as np
 
 from ..core.constants import PhysicalConstants, PotentialParameters
+from ..utils.environment import parallel_blas
 
 
 class PotentialStrategy(ABC):
@@ -39,8 +42,32 @@ class DoubleWellPotential(PotentialStrategy):
     """
 
     def __init__(self, parameters: Optional[PotentialParameters] = None):
+        self._k = PhysicalConstants.BOHR_TO_ANGSTROM  # Hartree/Å -> Hartree/Bohr
         self.params = parameters or PotentialParameters()
 
+    @property
+    def params(self) -> PotentialParameters:
+        """Potential parameters (frozen; assign a new instance to change them)."""
+        return self._params
+
+    @params.setter
+    def params(self, parameters: PotentialParameters) -> None:
+        self._params = parameters
+        self._update_prefactors()
+
+    def _update_prefactors(self) -> None:
+        """
+        Precompute force prefactors as plain floats from the current params:
+          quartic:          -d/dx(a*x^4)         = -4*a*x^3
+          quadratic:        -d/dx(-b*x^2)        = 2*b*x
+          Gaussian barrier: -d/dx(c*exp(-d*x^2)) = 2*c*d*x*exp(-d*x^2)
+        """
+        p = self._params
+        self._neg4a = -4.0 * p.quartic_coefficient
+        self._2b = 2.0 * p.quadratic_coefficient
+        self._2cd = 2.0 * p.barrier_height * p.barrier_width
+        self._d = float(p.barrier_width)
+
     def calculate_force(self, position: float) -> float:
         """
         Calculate force at given position.
@@ -54,31 +81,10 @@ class DoubleWellPotential(PotentialStrategy):
         Returns:
             Force in atomic units (Hartree/Bohr)
         """
-        quartic_term = self._calculate_quartic_force(position)
-        quadratic_term = self._calculate_quadratic_force(position)
-        gaussian_barrier_term = self._calculate_gaussian_barrier_force(position)
-
-        # Sum gives force in Hartree/Ångström (since position is in Å)
-        force_per_angstrom = quartic_term + quadratic_term + gaussian_barrier_term
-
-        # Convert from Hartree/Ångström to atomic units (Hartree/Bohr)
-        force_au = force_per_angstrom * PhysicalConstants.BOHR_TO_ANGSTROM
-
-        return force_au
-
-    def _calculate_quartic_force(self, position: float) -> float:
-        """Force from quartic term: -d/dx(a*x^4) = -4*a*x^3."""
-        return -4.0 * self.params.quartic_coefficient * position**3
-
-    def _calculate_quadratic_force(self, position: float) -> float:
-        """Force from quadratic term: -d/dx(-b*x^2) = 2*b*x."""
-        return 2.0 * self.params.quadratic_coefficient * position
-
-    def _calculate_gaussian_barrier_force(self, position: float) -> float:
-        """Force from Gaussian barrier: -d/dx(c*exp(-d*x^2)) = 2*c*d*x*exp(-d*x^2)."""
-        exponential = np.exp(-self.params.barrier_width * position**2)
-        return (2.0 * self.params.barrier_height * self.params.barrier_width
-                * position * exponential)
+        x2 = position * position
+        return (self._neg4a * x2 * position
+                + self._2b * position
+                + self._2cd * position * math.exp(-self._d * x2)) * self._k
 
 
 class PySCFGradientPotential(PotentialStrategy):
@@ -89,16 +95,61 @@ class PySCFGradientPotential(PotentialStrategy):
     potential energy surface. This is the CORRECT way to get forces!
     """
 
-    def __init__(self, neo_calculator, step_size: float = 0.001):
+    # Energy cache: keys are proton x positions (Å) rounded to this many decimals
+    CACHE_DECIMALS = 6
+    # Purge cache entries farther than CACHE_WINDOW_STEPS * step_size every
+    # CACHE_PURGE_INTERVAL gradient calls
+    CACHE_PURGE_INTERVAL = 50
+    CACHE_WINDOW_STEPS = 5
+    # Finite-difference modes accepted by the mode argument
+    FD_MODES = ('central', 'forward')
+
+    def __init__(self, neo_calculator, step_size: float = 0.001,
+                 interpolate: bool = False,
+                 mode: str = 'central',
+                 recalibrate_interval: int = 10,
+                 fd_tolerance: float = 1e-4,
+                 blas_threads: Optional[int] = 1):
         """
         Initialize with NEO calculator.
 
         Args:
             neo_calculator: NEOCalculator instance with initialized NEO system
             step_size: Finite difference step size in Angstroms (default: 0.001 Å)
+            interpolate: When three cached energies bracket the position within
+                2*step_size, take the gradient from a local quadratic fit instead
+                of running new SCFs (default: False)
+            mode: 'central' runs two SCFs per force call; 'forward' pairs one new
+                SCF with the energy from the previous call when the proton is
+                within 2*step_size of that point (default: 'central')
+            recalibrate_interval: In 'forward' mode, run a full central difference
+                after this many one-sided gradients (default: 10)
+            fd_tolerance: In 'forward' mode, gradient discrepancy (Hartree/Å)
+                between one-sided and central estimates above which step_size
+                is halved; it is doubled back (up to its initial value) when the
+                discrepancy falls below a tenth of this (default: 1e-4)
+            blas_threads: BLAS/OpenMP threads for the scanner SCFs. 1 keeps the
+                process-wide single-threaded setting; None uses all cores.
+                Requires threadpoolctl to take effect (default: 1)
         """
+        if mode not in self.FD_MODES:
+            raise ValueError(f"Unknown finite-difference mode '{mode}' "
+                             f"(expected one of {self.FD_MODES})")
+
         self.neo_calc = neo_calculator
         self.step_size = step_size  # in Angstroms
+        self.interpolate = interpolate
+        self._mode = mode
+        self.recalibrate_interval = recalibrate_interval
+        self.fd_tolerance = fd_tolerance
+        self.blas_threads = blas_threads
+        self._max_step_size = step_size
+        self._min_step_size = step_size / 16
+        self._last_position = None  # Most recent FD point (Å) and its energy
+        self._last_energy = None
+        self._forward_since_check = 0
+        self.last_fd_error = None
+        self._energy_cache: Dict[float, float] = {}
 
         # Create PES scanner for fast energy calculations
         if self.neo_calc.neo_mf is not None:
@@ -113,6 +164,9 @@ class PySCFGradientPotential(PotentialStrategy):
         # Statistics
         self.num_gradient_calls = 0
         self.num_energy_evals = 0
+        self.num_cache_hits = 0
+        self.num_interpolated = 0
+        self.num_forward_gradients = 0
 
     def _cache_geometry_template(self) -> None:
         """Cache the base geometry for efficient updates."""
@@ -127,6 +181,11 @@ class PySCFGradientPotential(PotentialStrategy):
 
         # Proton is last atom (index 2)
         self.proton_index = 2
+
+        # Scratch geometries reused for displaced evaluations (one per point of the
+        # central stencil): only the proton x entry changes, so no per-call
+        # allocation is needed
+        self._scratch_geometries = np.repeat(self.geometry_template[np.newaxis], 2, axis=0)
         print(f"[DEBUG] Geometry template cached: {self.geometry_template.shape}")
 
     def calculate_force(self, position: float) -> float:
@@ -136,6 +195,13 @@ class PySCFGradientPotential(PotentialStrategy):
         Force F = -dE/dx calculated via centered finite difference:
         F(x) = -(E(x+δ) - E(x-δ)) / (2δ)
 
+        Energies are cached by proton position (rounded to CACHE_DECIMALS Å), so
+        displaced points revisited by later steps do not trigger new SCFs.
+
+        In 'forward' mode the gradient is usually taken between the previous
+        call's FD point and one new point on the other side of position, which
+        costs a single SCF; see _forward_gradient.
+
         Args:
             position: Proton position in Angstroms
 
@@ -143,23 +209,22 @@ class PySCFGradientPotential(PotentialStrategy):
             Force in atomic units
         """
         self.num_gradient_calls += 1
-
-        # Create geometries for finite difference
-        geom_minus = self.geometry_template.copy()
-        geom_plus = self.geometry_template.copy()
-
-        # Update proton position (x-coordinate only)
-        geom_minus[self.proton_index, 0] = position - self.step_size
-        geom_plus[self.proton_index, 0] = position + self.step_size
-
-        # Calculate energies at displaced geometries
-        energy_minus = self._calculate_energy_at_geometry(geom_minus)
-        energy_plus = self._calculate_energy_at_geometry(geom_plus)
-
-        self.num_energy_evals += 2
-
-        # Centered finite difference for gradient
-        gradient = (energy_plus - energy_minus) / (2.0 * self.step_size)
+        if self.num_gradient_calls % self.CACHE_PURGE_INTERVAL == 0:
+            self._purge_energy_cache(position)
+
+        if self.interpolate:
+            gradient = self._interpolate_gradient(position)
+            if gradient is not None:
+                self.num_interpolated += 1
+                return -gradient * PhysicalConstants.BOHR_TO_ANGSTROM
+
+        # Calculate energies at displaced positions (reusing cached values). The
+        # scanner starts each SCF from the density it last converged, which lies
+        # within |Δx| + 2δ of the new geometry.
+        if self._mode == 'forward':
+            gradient = self._forward_gradient(position)
+        else:
+            gradient = self._central_gradient(position)
 
         # Force is negative gradient: F = -dE/dx
         force = -gradient
@@ -169,6 +234,120 @@ class PySCFGradientPotential(PotentialStrategy):
 
         return force_au
 
+    def _central_gradient(self, position: float) -> float:
+        """Centered finite-difference dE/dx (Hartree/Å) over the rounded cache points."""
+        x_minus = round(position - self.step_size, self.CACHE_DECIMALS)
+        x_plus = round(position + self.step_size, self.CACHE_DECIMALS)
+        energy_minus, energy_plus = self._cached_energies((x_minus, x_plus))
+
+        self._last_position = x_plus
+        self._last_energy = energy_plus
+        return (energy_plus - energy_minus) / (x_plus - x_minus)
+
+    def _forward_gradient(self, position: float) -> float:
+        """
+        One-SCF finite-difference dE/dx (Hartree/Å) reusing the previous FD point.
+
+        The new point goes on the opposite side of position from the previous one,
+        so the stencil spans between step_size and 3*step_size and its midpoint
+        lies within step_size/2 of position. Falls back to a central difference
+        when the previous point is more than 2*step_size away, and runs one
+        every recalibrate_interval calls to measure the one-sided error and adapt
+        step_size.
+        """
+        last_x = self._last_position
+        last_energy = self._last_energy
+        if last_x is None or abs(position - last_x) > 2.0 * self.step_size:
+            self._forward_since_check = 0
+            return self._central_gradient(position)
+
+        delta = self.step_size if last_x <= position else -self.step_size
+        new_x = round(position + delta, self.CACHE_DECIMALS)
+
+        if self._forward_since_check < self.recalibrate_interval:
+            new_energy = self._cached_energy(new_x)
+            self._last_position = new_x
+            self._last_energy = new_energy
+            self._forward_since_check += 1
+            self.num_forward_gradients += 1
+            return (new_energy - last_energy) / (new_x - last_x)
+
+        # Recalibration: new_x is one of the central points, so the one-sided
+        # estimate for comparison needs no extra SCF
+        central = self._central_gradient(position)
+        forward = (self._energy_cache[new_x] - last_energy) / (new_x - last_x)
+        self._adapt_step_size(abs(forward - central))
+        self._forward_since_check = 0
+        return central
+
+    def _adapt_step_size(self, error: float) -> None:
+        """Halve or double step_size based on the one-sided vs central discrepancy."""
+        self.last_fd_error = float(error)
+        if error > self.fd_tolerance:
+            self.step_size = max(0.5 * self.step_size, self._min_step_size)
+        elif error < 0.1 * self.fd_tolerance:
+            self.step_size = min(2.0 * self.step_size, self._max_step_size)
+
+    def _cached_energy(self, proton_x: float) -> float:
+        """
+        Energy with the proton at proton_x (Å), from cache or a new SCF.
+
+        proton_x must already be rounded to CACHE_DECIMALS (it is the cache key).
+        """
+        return self._cached_energies((proton_x,))[0]
+
+    def _cached_energies(self, proton_xs) -> list:
+        """
+        Energies with the proton at each of proton_xs (Å), from cache or new SCFs.
+
+        Uncached positions are evaluated together; positions must already be
+        rounded to CACHE_DECIMALS, and at most two may be passed (the size of the
+        scratch geometry stack).
+        """
+        missing = [x for x in proton_xs if x not in self._energy_cache]
+        self.num_cache_hits += len(proton_xs) - len(missing)
+
+        if missing:
+            geometries = self._scratch_geometries[:len(missing)]
+            geometries[:, self.proton_index, 0] = missing
+            energies = self._calculate_energies_at_geometries(geometries)
+            self.num_energy_evals += len(missing)
+            self._energy_cache.update(zip(missing, energies.tolist()))
+
+        return [self._energy_cache[x] for x in proton_xs]
+
+    def _purge_energy_cache(self, position: float) -> None:
+        """Drop cached energies outside the window around the current position."""
+        window = self.CACHE_WINDOW_STEPS * self.step_size
+        self._energy_cache = {x: e for x, e in self._energy_cache.items()
+                              if abs(x - position) <= window}
+
+    def _interpolate_gradient(self, position: float) -> Optional[float]:
+        """
+        Gradient dE/dx (Hartree/Å) from a quadratic fit to three cached energies.
+
+        Takes cached points within 2*step_size of position, nearest first,
+        skipping any closer than ~step_size to one already chosen: closely spaced
+        points would amplify SCF convergence noise by 1/spacing. Returns None
+        unless three such points exist and bracket position.
+        """
+        window = 2.0 * self.step_size
+        min_spacing = 0.9 * self.step_size  # Slack for cache-key rounding
+        xs = []
+        for _, x in sorted((abs(x - position), x) for x in self._energy_cache
+                           if abs(x - position) <= window):
+            if all(abs(x - chosen) >= min_spacing for chosen in xs):
+                xs.append(x)
+                if len(xs) == 3:
+                    break
+        if len(xs) < 3:
+            return None
+        if not (min(xs) < position < max(xs)):
+            return None
+
+        c2, c1, _ = np.polyfit(xs, [self._energy_cache[x] for x in xs], 2)
+        return c1 + 2.0 * c2 * position
+
     def _calculate_energy_at_geometry(self, geometry: np.ndarray) -> float:
         """
         Calculate NEO-HF energy at given geometry.
@@ -179,15 +358,38 @@ class PySCFGradientPotential(PotentialStrategy):
         Returns:
             Total energy in Hartree
         """
-        # Use scanner for fast energy calculation
-        energy = self.pes_scanner(geometry)
-        return energy
+        # Use scanner for fast energy calculation (warm-started from its last
+        # converged density)
+        return self.pes_scanner(geometry)
+
+    def _calculate_energies_at_geometries(self, geometries: np.ndarray) -> np.ndarray:
+        """
+        Calculate NEO-HF energies for several geometries.
+
+        Geometries are run through the scanner one after another inside a single
+        blas_threads section.
+
+        Args:
+            geometries: Geometries as (N_geometries, N_atoms, 3) array in Angstroms
+
+        Returns:
+            Total energies in Hartree, shape (N_geometries,)
+        """
+        threads = nullcontext() if self.blas_threads == 1 else parallel_blas(self.blas_threads)
+        with threads:
+            return np.array([self._calculate_energy_at_geometry(geometry)
+                             for geometry in geometries])
 
     def get_statistics(self) -> Dict:
         """Return statistics about gradient calculations."""
         return {
             'num_gradient_calls': self.num_gradient_calls,
             'num_energy_evals': self.num_energy_evals,
+            'num_cache_hits': self.num_cache_hits,
+            'num_interpolated': self.num_interpolated,
+            'num_forward_gradients': self.num_forward_gradients,
+            'step_size': self.step_size,
+            'last_fd_error': self.last_fd_error,
             'avg_evals_per_gradient': (self.num_energy_evals / self.num_gradient_calls
                                       if self.num_gradient_calls > 0 else 0)
         }
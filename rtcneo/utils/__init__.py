@@ -2,12 +2,20 @@
 
 from .environment import (
     configure_environment_for_macos,
+    configure_environment_for_macos_safe,
+    enable_parallel_blas,
+    parallel_blas,
     setup_pyscf_neo_path,
     initialize_environment
 )
+from .optimize import scalar_optimize
 
 __all__ = [
     'configure_environment_for_macos',
+    'configure_environment_for_macos_safe',
+    'enable_parallel_blas',
+    'parallel_blas',
     'setup_pyscf_neo_path',
     'initialize_environment',
+    'scalar_optimize',
 ]
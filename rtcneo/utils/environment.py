@@ -2,16 +2,39 @@
 Environment configuration for RT-cNEO.
 
 Critical macOS compatibility settings for PySCF-NEO.
+
+Thread policy is per phase: the process starts single-threaded (safe for the
+NEO-HF build), and compute-bound sections such as the PES-scanner SCFs in
+PySCFGradientPotential can raise the BLAS/OpenMP thread count with
+parallel_blas(). Changing thread counts of already-loaded libraries requires
+the optional threadpoolctl package.
+
+On macOS, Accelerate reads VECLIB_MAXIMUM_THREADS only when it is loaded and is
+not controllable by threadpoolctl, so once numpy is imported only the OpenMP
+runtimes (PySCF's integral and Fock builds) follow these settings; call
+enable_parallel_blas() before importing numpy to lift the Accelerate limit.
 """
 
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 
+try:
+    import threadpoolctl
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+    threadpoolctl = None
 
-def configure_environment_for_macos() -> None:
+_THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                    'VECLIB_MAXIMUM_THREADS')
+
+
+def configure_environment_for_macos_safe() -> None:
     """
-    Configure threading environment for macOS compatibility.
+    Configure single-threaded environment for macOS compatibility.
 
     CRITICAL: Must be called BEFORE importing numpy/scipy/PySCF to prevent
     BLAS threading deadlock on macOS Accelerate framework.
@@ -24,6 +47,53 @@ def configure_environment_for_macos() -> None:
     os.environ['OPENBLAS_NUM_THREADS'] = '1'
 
 
+def configure_environment_for_macos() -> None:
+    """Backwards-compatible alias for configure_environment_for_macos_safe()."""
+    configure_environment_for_macos_safe()
+
+
+def enable_parallel_blas(n: Optional[int] = None) -> int:
+    """
+    Switch BLAS/OpenMP to n threads for the rest of the process.
+
+    Updates the thread-count environment variables (read by libraries loaded
+    later) and, if threadpoolctl is installed, re-applies the limit to
+    libraries that are already loaded (except Accelerate on macOS).
+
+    Args:
+        n: Number of threads. If None, uses os.cpu_count().
+
+    Returns:
+        Number of threads requested
+    """
+    n = n or os.cpu_count() or 1
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(n)
+    if THREADPOOLCTL_AVAILABLE:
+        # Scans the libraries loaded now (milliseconds), so runtimes imported
+        # after an earlier call are covered too
+        threadpoolctl.threadpool_limits(limits=n)
+    return n
+
+
+@contextmanager
+def parallel_blas(n: Optional[int] = None):
+    """
+    Temporarily run already-loaded BLAS/OpenMP libraries with n threads.
+
+    A no-op without threadpoolctl, since environment variables have no effect
+    once the libraries are loaded.
+
+    Args:
+        n: Number of threads. If None, uses os.cpu_count().
+    """
+    if not THREADPOOLCTL_AVAILABLE:
+        yield
+        return
+    with threadpoolctl.threadpool_limits(limits=n or os.cpu_count() or 1):
+        yield
+
+
 def setup_pyscf_neo_path(pyscf_path: str = None) -> None:
     """
     Add Yang's PySCF-NEO to Python path.
@@ -53,5 +123,5 @@ def initialize_environment(pyscf_path: str = None) -> None:
     Args:
         pyscf_path: Optional custom path to PySCF-NEO installation
     """
-    configure_environment_for_macos()
+    configure_environment_for_macos_safe()
     setup_pyscf_neo_path(pyscf_path)
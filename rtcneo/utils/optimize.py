@@ -0,0 +1,33 @@
+"""
+Scalar parameter optimization for RT-cNEO.
+
+One-dimensional tuning problems (smoothing_time, field strength, ...) should use
+scalar_optimize rather than a general multivariate minimizer.
+"""
+
+from typing import Callable, Tuple
+
+
+def scalar_optimize(f: Callable[[float], float], bounds: Tuple[float, float],
+                    xatol: float = 1e-5, maxiter: int = 500):
+    """
+    Minimize a scalar function of one variable on a closed interval.
+
+    Wraps scipy.optimize.minimize_scalar with the bounded Brent method:
+    derivative-free, guaranteed to converge, and superlinear on smooth
+    objectives. SciPy is imported on first call so that importing rtcneo.utils
+    stays safe before configure_environment_for_macos() has run.
+
+    Args:
+        f: Objective f(x) -> float
+        bounds: (lower, upper) search interval
+        xatol: Absolute tolerance on the minimizer (default: 1e-5)
+        maxiter: Maximum number of function evaluations (default: 500)
+
+    Returns:
+        scipy.optimize.OptimizeResult with x (minimizer), fun, nfev and success
+    """
+    from scipy.optimize import minimize_scalar
+
+    return minimize_scalar(f, bounds=bounds, method='bounded',
+                           options={'xatol': xatol, 'maxiter': maxiter})
@@ -54,6 +54,10 @@ setup(
             "sphinx-rtd-theme",
             "myst-parser",
         ],
+        "fast": [
+            "numba>=0.56",
+            "threadpoolctl>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [